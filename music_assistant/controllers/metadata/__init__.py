@@ -123,14 +123,13 @@ class MetaDataController:
         # first try audiodb
         if musicbrainz_id := await self.audiodb.get_musicbrainz_id(artist, ref_albums):
             return musicbrainz_id
-        # try again with musicbrainz with albums with upc
+        # try again with musicbrainz with albums with upc (in a single batched search)
+        if album_upcs := [x.upc for x in ref_albums if x.upc]:
+            if musicbrainz_id := await self.musicbrainz.search_artist_by_album_upcs(
+                artist.name, album_upcs
+            ):
+                return musicbrainz_id
         for ref_album in ref_albums:
-            if ref_album.upc:
-                if musicbrainz_id := await self.musicbrainz.get_mb_artist_id(
-                    artist.name,
-                    album_upc=ref_album.upc,
-                ):
-                    return musicbrainz_id
             if ref_album.musicbrainz_id:
                 if musicbrainz_id := await self.musicbrainz.search_artist_by_album_mbid(
                     artist.name, ref_album.musicbrainz_id
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     from music_assistant.mass import MusicAssistant
 
 LUCENE_SPECIAL = r'([+\-&|!(){}\[\]\^"~*?:\\\/])'
+UPC_BATCH_SIZE = 25
 
 
 class MusicBrainz:
@@ -127,6 +128,37 @@ class MusicBrainz:
                                 return artist["id"]
         return ""
 
+    async def search_artist_by_album_upcs(
+        self, artistname: str, album_upcs: list[str]
+    ) -> str:
+        """
+        Retrieve musicbrainz artist id by providing the artist name and album upc's.
+
+        All barcodes are OR-joined into a single query to save round-trips to the
+        (rate limited) api.
+        """
+        for idx in range(0, len(album_upcs), UPC_BATCH_SIZE):
+            upcs = album_upcs[idx : idx + UPC_BATCH_SIZE]
+            query = " OR ".join(f"barcode:{upc}" for upc in upcs)
+            result = await self.get_data("release", query=query, limit=100)
+            if not (result and "releases" in result):
+                continue
+            for item in result["releases"]:
+                for artist in item["artist-credit"]:
+                    mb_artist = artist["artist"]
+                    if compare_strings(mb_artist["name"], artistname, True) or any(
+                        compare_strings(alias["name"], artistname, True)
+                        for alias in mb_artist.get("aliases", [])
+                    ):
+                        self.logger.debug(
+                            "Got MusicbrainzArtistId for %s after search on upc(s) %s --> %s",
+                            artistname,
+                            ", ".join(upcs),
+                            mb_artist["id"],
+                        )
+                        return mb_artist["id"]
+        return ""
+
     async def search_artist_by_track(
         self, artistname, trackname=None, track_isrc=None, strict=True
     ):
@@ -8,7 +8,12 @@ from typing import Dict, List, Optional, Union
 from databases import Database as Db
 
 from music_assistant.helpers.compare import compare_album, compare_artist
-from music_assistant.helpers.database import TABLE_ALBUMS, TABLE_TRACKS
+from music_assistant.helpers.database import (
+    TABLE_ALBUM_ARTISTS,
+    TABLE_ALBUMS,
+    TABLE_TRACK_ARTISTS,
+    TABLE_TRACKS,
+)
 from music_assistant.helpers.json import json_serializer
 from music_assistant.models.enums import EventType, ProviderType
 from music_assistant.models.event import MassEvent
@@ -161,6 +166,9 @@ class AlbumsController(MediaControllerBase[Album]):
                 db=db,
             )
             item_id = new_item["item_id"]
+            await self._set_db_artists(
+                item_id, album_artists, TABLE_ALBUM_ARTISTS, "album_id", db=db
+            )
             self.logger.debug("added %s to database", item.name)
             # return created object
             db_item = await self.get_db_item(item_id, db=db)
@@ -215,6 +223,9 @@ class AlbumsController(MediaControllerBase[Album]):
                 },
                 db=db,
             )
+            await self._set_db_artists(
+                item_id, album_artists, TABLE_ALBUM_ARTISTS, "album_id", db=db
+            )
             self.logger.debug("updated %s in database: %s", item.name, item_id)
             db_item = await self.get_db_item(item_id, db=db)
             self.mass.signal_event(
@@ -229,8 +240,18 @@ class AlbumsController(MediaControllerBase[Album]):
 
         # delete tracks connected to this album
         async with self.mass.database.get_db(db) as db:
+            params = {"album_id": f'%"{item_id}"%'}
             await self.mass.database.delete_where_query(
-                TABLE_TRACKS, f"albums LIKE '%\"{item_id}\"%'", db=db
+                TABLE_TRACK_ARTISTS,
+                f"track_id IN (SELECT item_id FROM {TABLE_TRACKS} WHERE albums LIKE :album_id)",
+                params,
+                db=db,
+            )
+            await self.mass.database.delete_where_query(
+                TABLE_TRACKS, "albums LIKE :album_id", params, db=db
+            )
+            await self.mass.database.delete(
+                TABLE_ALBUM_ARTISTS, {"album_id": int(item_id)}, db=db
             )
         # delete the album itself from db
         await super().delete_db_item(item_id, db)
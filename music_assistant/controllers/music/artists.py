@@ -1,12 +1,20 @@
 """Manage MediaItems of type Artist."""
 
 import asyncio
-import itertools
-from typing import Dict, List, Optional
+from copy import copy
+from time import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from databases import Database as Db
 
-from music_assistant.helpers.database import TABLE_ALBUMS, TABLE_ARTISTS, TABLE_TRACKS
+from music_assistant.helpers.cache import MemoryCache
+from music_assistant.helpers.database import (
+    TABLE_ALBUM_ARTISTS,
+    TABLE_ALBUMS,
+    TABLE_ARTISTS,
+    TABLE_TRACK_ARTISTS,
+    TABLE_TRACKS,
+)
 from music_assistant.helpers.json import json_serializer
 from music_assistant.models.enums import EventType, ProviderType
 from music_assistant.models.event import MassEvent
@@ -15,12 +23,43 @@ from music_assistant.models.media_items import (
     Album,
     AlbumType,
     Artist,
-    ItemMapping,
+    MediaItemMetadata,
+    MediaItemProviderId,
     MediaType,
     Track,
 )
 from music_assistant.models.music_provider import MusicProvider
 
+# the memory layer is short-lived, the persistent cache determines the real expiration
+PROV_ITEMS_MEM_CACHE_EXPIRATION = 3600
+# number of (nested) entries above which the json columns are serialized in the executor
+LARGE_JSON_THRESHOLD = 100
+# max number of reference tracks that are tried concurrently when matching an artist
+MATCH_WINDOW_SIZE = 3
+
+
+def _count_json_entries(
+    metadata: MediaItemMetadata, provider_ids: Set[MediaItemProviderId]
+) -> int:
+    """Return (rough) number of nested objects that need to be serialized."""
+    return len(provider_ids) + sum(
+        len(value)
+        for value in (
+            metadata.images,
+            metadata.genres,
+            metadata.links,
+            metadata.performers,
+        )
+        if value
+    )
+
+
+def _serialize_json_columns(
+    metadata: MediaItemMetadata, provider_ids: Set[MediaItemProviderId]
+) -> Tuple[str, str]:
+    """Serialize the metadata and provider_ids columns of an artist."""
+    return json_serializer(metadata), json_serializer(provider_ids)
+
 
 class ArtistsController(MediaControllerBase[Artist]):
     """Controller managing MediaItems of type Artist."""
@@ -29,6 +68,12 @@ class ArtistsController(MediaControllerBase[Artist]):
     media_type = MediaType.ARTIST
     item_cls = Artist
 
+    def __init__(self, *args, **kwargs):
+        """Initialize class."""
+        super().__init__(*args, **kwargs)
+        # keep (already parsed) provider toptracks/albums of recently used artists in memory
+        self._prov_items_cache = MemoryCache(200)
+
     async def toptracks(
         self,
         item_id: str,
@@ -37,20 +82,22 @@ class ArtistsController(MediaControllerBase[Artist]):
     ) -> List[Track]:
         """Return top tracks for an artist."""
         artist = await self.get(item_id, provider, provider_id)
-        # get results from all providers
+        # get results from all (available) providers
         coros = [
-            self.get_provider_artist_toptracks(item.item_id, item.prov_id)
+            self._get_provider_artist_toptracks(item.item_id, prov)
             for item in artist.provider_ids
+            if (prov := self.mass.music.get_provider(item.prov_id))
         ]
-        tracks = itertools.chain.from_iterable(await asyncio.gather(*coros))
-        # merge duplicates using a dict
-        final_items: Dict[str, Track] = {}
-        for track in tracks:
-            key = f".{track.name}.{track.version}"
-            if key in final_items:
-                final_items[key].provider_ids.update(track.provider_ids)
-            else:
-                final_items[key] = track
+        # merge duplicates using a dict (as soon as each provider returns its results)
+        final_items: Dict[Tuple[str, str], Track] = {}
+        for prov_items in asyncio.as_completed(coros):
+            for track in await prov_items:
+                key = (track.name, track.version)
+                existing = final_items.setdefault(key, track)
+                if existing is not track:
+                    # merge into a copy as the provider items are shared with the memory cache
+                    final_items[key] = merged = copy(existing)
+                    merged.provider_ids = {*existing.provider_ids, *track.provider_ids}
         return list(final_items.values())
 
     async def albums(
@@ -61,22 +108,23 @@ class ArtistsController(MediaControllerBase[Artist]):
     ) -> List[Album]:
         """Return (all/most popular) albums for an artist."""
         artist = await self.get(item_id, provider, provider_id)
-        # get results from all providers
+        # get results from all (available) providers
         coros = [
-            self.get_provider_artist_albums(item.item_id, item.prov_id)
+            self._get_provider_artist_albums(item.item_id, prov)
             for item in artist.provider_ids
+            if (prov := self.mass.music.get_provider(item.prov_id))
         ]
-        albums = itertools.chain.from_iterable(await asyncio.gather(*coros))
-        # merge duplicates using a dict
-        final_items: Dict[str, Album] = {}
-        for album in albums:
-            key = f".{album.name}.{album.version}"
-            if key in final_items:
-                final_items[key].provider_ids.update(album.provider_ids)
-            else:
-                final_items[key] = album
-            if album.in_library:
-                final_items[key].in_library = True
+        # merge duplicates using a dict (as soon as each provider returns its results)
+        final_items: Dict[Tuple[str, str], Album] = {}
+        for prov_items in asyncio.as_completed(coros):
+            for album in await prov_items:
+                key = (album.name, album.version)
+                existing = final_items.setdefault(key, album)
+                if existing is not album:
+                    # merge into a copy as the provider items are shared with the memory cache
+                    final_items[key] = merged = copy(existing)
+                    merged.provider_ids = {*existing.provider_ids, *album.provider_ids}
+                    merged.in_library = existing.in_library or album.in_library
         return list(final_items.values())
 
     async def add(self, item: Artist) -> Artist:
@@ -85,33 +133,76 @@ class ArtistsController(MediaControllerBase[Artist]):
         await self.mass.metadata.get_artist_metadata(item)
         db_item = await self.add_db_item(item)
         # also fetch same artist on all providers
-        await self.match_artist(db_item)
-        db_item = await self.get_db_item(db_item.item_id)
+        if await self.match_artist(db_item):
+            # refresh the db item only if matching updated it
+            db_item = await self.get_db_item(db_item.item_id)
         return db_item
 
-    async def match_artist(self, db_artist: Artist):
+    async def match_artist(self, db_artist: Artist) -> bool:
         """
         Try to find matching artists on all providers for the provided (database) item_id.
 
         This is used to link objects of different providers together.
+        Returns True if the database item was updated with (a) match(es).
         """
         assert (
             db_artist.provider == ProviderType.DATABASE
         ), "Matching only supported for database items!"
         cur_prov_types = {x.prov_type for x in db_artist.provider_ids}
-        for provider in self.mass.music.providers:
-            if provider.type in cur_prov_types:
-                continue
-            if MediaType.ARTIST not in provider.supported_mediatypes:
+        eligible = [
+            provider
+            for provider in self.mass.music.providers
+            if provider.type not in cur_prov_types
+            and MediaType.ARTIST in provider.supported_mediatypes
+        ]
+        if not eligible:
+            return False
+        # grab the reference tracks/albums once for all providers,
+        # albums are only fetched (once) if a provider needs to fall back to them
+        ref_tracks = await self.toptracks(db_artist.item_id, db_artist.provider)
+        ref_albums_task: Optional[asyncio.Task] = None
+
+        async def get_ref_albums() -> List[Album]:
+            nonlocal ref_albums_task
+            if ref_albums_task is None:
+                ref_albums_task = asyncio.create_task(
+                    self.albums(db_artist.item_id, db_artist.provider)
+                )
+            # shield the shared task from cancellation of a single match attempt
+            return await asyncio.shield(ref_albums_task)
+
+        # probe all providers concurrently, the db updates are applied one by one
+        # afterwards to prevent concurrent updates overwriting each other's provider ids
+        results = await asyncio.gather(
+            *(
+                self._match(db_artist, provider, ref_tracks, get_ref_albums)
+                for provider in eligible
+            ),
+            return_exceptions=True,
+        )
+        updated = False
+        for provider, prov_artist in zip(eligible, results):
+            if isinstance(prov_artist, Exception):
+                self.logger.warning(
+                    "Error while matching Artist %s on provider %s: %s",
+                    db_artist.name,
+                    provider.name,
+                    str(prov_artist),
+                )
                 continue
-            if await self._match(db_artist, provider):
-                cur_prov_types.add(provider.type)
-            else:
+            if prov_artist is None:
                 self.logger.debug(
                     "Could not find match for Artist %s on provider %s",
                     db_artist.name,
                     provider.name,
                 )
+                continue
+            if provider.type in cur_prov_types:
+                continue
+            await self.update_db_item(db_artist.item_id, prov_artist)
+            cur_prov_types.add(provider.type)
+            updated = True
+        return updated
 
     async def get_provider_artist_toptracks(
         self, item_id: str, provider_id: str
@@ -120,17 +211,26 @@ class ArtistsController(MediaControllerBase[Artist]):
         prov = self.mass.music.get_provider(provider_id)
         if not prov:
             return []
+        return await self._get_provider_artist_toptracks(item_id, prov)
+
+    async def _get_provider_artist_toptracks(
+        self, item_id: str, prov: MusicProvider
+    ) -> List[Track]:
+        """Return top tracks for an artist on given (resolved) provider."""
         # prefer cache items (if any)
         cache_key = f"{prov.type.value}.artist_toptracks.{item_id}"
+        if items := self._get_mem_cached_items(cache_key):
+            return items
         if cache := await self.mass.cache.get(cache_key):
-            return [Track.from_dict(x) for x in cache]
+            items = [Track.from_dict(x) for x in cache]
+            self._set_mem_cached_items(cache_key, items)
+            return list(items)
         # no items in cache - get listing from provider
         items = await prov.get_artist_toptracks(item_id)
         # store (serializable items) in cache
-        self.mass.create_task(
-            self.mass.cache.set(cache_key, [x.to_dict() for x in items])
-        )
-        return items
+        self._set_mem_cached_items(cache_key, items)
+        self.mass.create_task(self._store_in_cache(cache_key, items))
+        return list(items)
 
     async def get_provider_artist_albums(
         self, item_id: str, provider_id: str
@@ -139,17 +239,26 @@ class ArtistsController(MediaControllerBase[Artist]):
         prov = self.mass.music.get_provider(provider_id)
         if not prov:
             return []
+        return await self._get_provider_artist_albums(item_id, prov)
+
+    async def _get_provider_artist_albums(
+        self, item_id: str, prov: MusicProvider
+    ) -> List[Album]:
+        """Return albums for an artist on given (resolved) provider."""
         # prefer cache items (if any)
         cache_key = f"{prov.type.value}.artist_albums.{item_id}"
+        if items := self._get_mem_cached_items(cache_key):
+            return items
         if cache := await self.mass.cache.get(cache_key):
-            return [Album.from_dict(x) for x in cache]
+            items = [Album.from_dict(x) for x in cache]
+            self._set_mem_cached_items(cache_key, items)
+            return list(items)
         # no items in cache - get listing from provider
         items = await prov.get_artist_albums(item_id)
         # store (serializable items) in cache
-        self.mass.create_task(
-            self.mass.cache.set(cache_key, [x.to_dict() for x in items])
-        )
-        return items
+        self._set_mem_cached_items(cache_key, items)
+        self.mass.create_task(self._store_in_cache(cache_key, items))
+        return list(items)
 
     async def add_db_item(
         self, item: Artist, overwrite_existing: bool = False, db: Optional[Db] = None
@@ -157,29 +266,31 @@ class ArtistsController(MediaControllerBase[Artist]):
         """Add a new item record to the database."""
         assert item.provider_ids, "Album is missing provider id(s)"
         async with self.mass.database.get_db(db) as db:
-            # always try to grab existing item by musicbrainz_id
+            # grab existing item(s) by musicbrainz_id or name in a single query
+            # NOTE: we match an artist by name which could theoretically lead to collisions
+            # but the chance is so small it is not worth the additional overhead of grabbing
+            # the musicbrainz id upfront
             cur_item = None
+            query = f"SELECT * FROM {self.db_table} WHERE sort_name = :sort_name"
+            params = {"sort_name": item.sort_name}
             if item.musicbrainz_id:
-                match = {"musicbrainz_id": item.musicbrainz_id}
-                cur_item = await self.mass.database.get_row(self.db_table, match, db=db)
-            if not cur_item:
-                # fallback to matching
-                # NOTE: we match an artist by name which could theoretically lead to collisions
-                # but the chance is so small it is not worth the additional overhead of grabbing
-                # the musicbrainz id upfront
-                match = {"sort_name": item.sort_name}
-                for row in await self.mass.database.get_rows(
-                    self.db_table, match, db=db
-                ):
-                    row_artist = Artist.from_db_row(row)
-                    if row_artist.sort_name == item.sort_name:
-                        # just to be sure ?!
-                        cur_item = row_artist
-                        break
+                # musicbrainz id match always wins over a name match
+                query += " OR musicbrainz_id = :musicbrainz_id"
+                query += " ORDER BY musicbrainz_id = :musicbrainz_id DESC"
+                params["musicbrainz_id"] = item.musicbrainz_id
+            # only the (single) selected row is turned into an Artist object
+            if rows := await self.mass.database.get_rows_from_query(
+                query, params, limit=1, db=db
+            ):
+                cur_item = Artist.from_db_row(rows[0])
             if cur_item:
                 # update existing
                 return await self.update_db_item(
-                    cur_item.item_id, item, overwrite=overwrite_existing, db=db
+                    cur_item.item_id,
+                    item,
+                    overwrite=overwrite_existing,
+                    db=db,
+                    cur_item=cur_item,
                 )
 
             # insert item
@@ -203,15 +314,29 @@ class ArtistsController(MediaControllerBase[Artist]):
         item: Artist,
         overwrite: bool = False,
         db: Optional[Db] = None,
+        cur_item: Optional[Artist] = None,
     ) -> Artist:
-        """Update Artist record in the database."""
-        cur_item = await self.get_db_item(item_id)
+        """Update Artist record in the database (optionally pass the current db item)."""
+        if cur_item is None:
+            cur_item = await self.get_db_item(item_id, db=db)
         if overwrite:
             metadata = item.metadata
             provider_ids = item.provider_ids
         else:
             metadata = cur_item.metadata.update(item.metadata)
-            provider_ids = {*cur_item.provider_ids, *item.provider_ids}
+            provider_ids = set(cur_item.provider_ids)
+            provider_ids.update(item.provider_ids)
+
+        if _count_json_entries(metadata, provider_ids) > LARGE_JSON_THRESHOLD:
+            # serialize large metadata in a single executor job to not stall the loop
+            loop = asyncio.get_running_loop()
+            metadata_json, provider_ids_json = await loop.run_in_executor(
+                None, _serialize_json_columns, metadata, provider_ids
+            )
+        else:
+            metadata_json, provider_ids_json = _serialize_json_columns(
+                metadata, provider_ids
+            )
 
         async with self.mass.database.get_db(db) as db:
             await self.mass.database.update(
@@ -221,8 +346,8 @@ class ArtistsController(MediaControllerBase[Artist]):
                     "name": item.name if overwrite else cur_item.name,
                     "sort_name": item.sort_name if overwrite else cur_item.sort_name,
                     "musicbrainz_id": item.musicbrainz_id or cur_item.musicbrainz_id,
-                    "metadata": json_serializer(metadata),
-                    "provider_ids": json_serializer(provider_ids),
+                    "metadata": metadata_json,
+                    "provider_ids": provider_ids_json,
                 },
                 db=db,
             )
@@ -240,83 +365,150 @@ class ArtistsController(MediaControllerBase[Artist]):
 
         # delete tracks/albums connected to this artist
         async with self.mass.database.get_db(db) as db:
-            await self.mass.database.delete_where_query(
-                TABLE_TRACKS, f"artists LIKE '%\"{item_id}\"%'", db=db
-            )
-            await self.mass.database.delete_where_query(
-                TABLE_ALBUMS, f"artists LIKE '%\"{item_id}\"%'", db=db
-            )
+            for table, join_table, join_column in (
+                (TABLE_TRACKS, TABLE_TRACK_ARTISTS, "track_id"),
+                (TABLE_ALBUMS, TABLE_ALBUM_ARTISTS, "album_id"),
+            ):
+                sub_query = f"SELECT {join_column} FROM {join_table} WHERE artist_id = :artist_id"
+                params = {"artist_id": int(item_id)}
+                await self.mass.database.delete_where_query(
+                    table, f"item_id IN ({sub_query})", params, db=db
+                )
+                await self.mass.database.delete_where_query(
+                    join_table, f"{join_column} IN ({sub_query})", params, db=db
+                )
         # delete the artist itself from db
         await super().delete_db_item(item_id, db)
 
         self.logger.debug("deleted item with id %s from database", item_id)
 
-    async def _match(self, db_artist: Artist, provider: MusicProvider) -> bool:
-        """Try to find matching artists on given provider for the provided (database) artist."""
+    async def _match(
+        self,
+        db_artist: Artist,
+        provider: MusicProvider,
+        ref_tracks: List[Track],
+        get_ref_albums: Callable[[], Awaitable[List[Album]]],
+    ) -> Optional[Artist]:
+        """Try to find matching artist on given provider for the provided (database) artist."""
         self.logger.debug(
             "Trying to match artist %s on provider %s", db_artist.name, provider.name
         )
-        # try to get a match with some reference tracks of this artist
-        for ref_track in await self.toptracks(db_artist.item_id, db_artist.provider):
-            # make sure we have a full track
-            if isinstance(ref_track.album, ItemMapping):
-                ref_track = await self.mass.music.tracks.get(
-                    ref_track.item_id, ref_track.provider
+        # try to get a match with some reference tracks of this artist,
+        # reference tracks are tried concurrently in small windows and the first match wins
+        for idx in range(0, len(ref_tracks), MATCH_WINDOW_SIZE):
+            attempts = {
+                asyncio.create_task(
+                    self._try_match_ref_track(db_artist, provider, ref_track)
                 )
-            for search_str in (
-                f"{db_artist.name} - {ref_track.name}",
-                f"{db_artist.name} {ref_track.name}",
-                ref_track.name,
-            ):
-                search_results = await self.mass.music.tracks.search(
-                    search_str, provider.type
-                )
-                for search_result_item in search_results:
-                    if search_result_item.sort_name != ref_track.sort_name:
-                        continue
-                    # get matching artist from track
-                    for search_item_artist in search_result_item.artists:
-                        if search_item_artist.sort_name != db_artist.sort_name:
-                            continue
-                        # 100% album match
-                        # get full artist details so we have all metadata
-                        prov_artist = await self.get_provider_item(
-                            search_item_artist.item_id, search_item_artist.provider
-                        )
-                        await self.update_db_item(db_artist.item_id, prov_artist)
-                        return True
+                for ref_track in ref_tracks[idx : idx + MATCH_WINDOW_SIZE]
+            }
+            try:
+                while attempts:
+                    done, attempts = await asyncio.wait(
+                        attempts, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        if exc := task.exception():
+                            self.logger.debug(
+                                "Error while matching artist %s on provider %s: %s",
+                                db_artist.name,
+                                provider.name,
+                                str(exc),
+                            )
+                        elif prov_artist := task.result():
+                            return prov_artist
+            finally:
+                for task in attempts:
+                    task.cancel()
         # try to get a match with some reference albums of this artist
-        artist_albums = await self.albums(db_artist.item_id, db_artist.provider)
-        for ref_album in artist_albums:
+        for ref_album in await get_ref_albums():
             if ref_album.album_type == AlbumType.COMPILATION:
                 continue
             if ref_album.artist is None:
                 continue
-            for search_str in (
+            search_strs = (
                 ref_album.name,
                 f"{db_artist.name} - {ref_album.name}",
                 f"{db_artist.name} {ref_album.name}",
-            ):
-                search_result = await self.mass.music.albums.search(
-                    search_str, provider.type
+            )
+            # run all searches concurrently, results are evaluated in order of preference
+            all_search_results = await asyncio.gather(
+                *(
+                    self.mass.music.albums.search(search_str, provider.type)
+                    for search_str in search_strs
                 )
-                for search_result_item in search_result:
-                    if search_result_item.artist is None:
-                        continue
-                    if search_result_item.sort_name != ref_album.sort_name:
-                        continue
-                    # artist must match 100%
-                    if (
-                        search_result_item.artist.sort_name
-                        != ref_album.artist.sort_name
-                    ):
-                        continue
-                    # 100% match
-                    # get full artist details so we have all metadata
-                    prov_artist = await self.get_provider_item(
-                        search_result_item.artist.item_id,
-                        search_result_item.artist.provider,
-                    )
-                    await self.update_db_item(db_artist.item_id, prov_artist)
-                    return True
-        return False
+            )
+            # artist must match 100%
+            ref_sort_name = ref_album.sort_name
+            target = ref_album.artist.sort_name
+            candidates = (
+                search_result_item.artist
+                for search_result in all_search_results
+                for search_result_item in search_result
+                if search_result_item.artist is not None
+                and search_result_item.sort_name == ref_sort_name
+                and search_result_item.artist.sort_name == target
+            )
+            if match := next(candidates, None):
+                # 100% match
+                # get full artist details so we have all metadata
+                return await self.get_provider_item(match.item_id, match.provider)
+        return None
+
+    async def _try_match_ref_track(
+        self, db_artist: Artist, provider: MusicProvider, ref_track: Track
+    ) -> Optional[Artist]:
+        """Try to find matching artist on given provider using a reference track."""
+        # NOTE: only name and sort_name are needed so there is no need to fetch the full track
+        search_strs = (
+            f"{db_artist.name} - {ref_track.name}",
+            f"{db_artist.name} {ref_track.name}",
+            ref_track.name,
+        )
+        # run all searches concurrently, results are evaluated in order of preference
+        all_search_results = await asyncio.gather(
+            *(
+                self.mass.music.tracks.search(search_str, provider.type)
+                for search_str in search_strs
+            )
+        )
+        # get (first) matching artist from the matching tracks
+        target = db_artist.sort_name
+        ref_sort_name = ref_track.sort_name
+        candidates = (
+            search_item_artist
+            for search_results in all_search_results
+            for search_result_item in search_results
+            if search_result_item.sort_name == ref_sort_name
+            for search_item_artist in search_result_item.artists
+            if search_item_artist.sort_name == target
+        )
+        if match := next(candidates, None):
+            # 100% match
+            # get full artist details so we have all metadata
+            return await self.get_provider_item(match.item_id, match.provider)
+        return None
+
+    async def _store_in_cache(
+        self, cache_key: str, items: List[Union[Track, Album]]
+    ) -> None:
+        """Serialize and store provider items in the cache (in the background)."""
+        await self.mass.cache.set(cache_key, [x.to_dict() for x in items])
+
+    def _get_mem_cached_items(self, cache_key: str) -> List[Union[Track, Album]]:
+        """Return (a copy of the list of) provider items from the memory cache."""
+        if cache_key not in self._prov_items_cache:
+            return []
+        items, expires = self._prov_items_cache[cache_key]
+        if expires < time():
+            self._prov_items_cache.pop(cache_key)
+            return []
+        return list(items)
+
+    def _set_mem_cached_items(
+        self, cache_key: str, items: List[Union[Track, Album]]
+    ) -> None:
+        """Store (non empty) provider items in the memory cache."""
+        if items:
+            expires = time() + PROV_ITEMS_MEM_CACHE_EXPIRATION
+            self._prov_items_cache[cache_key] = (items, expires)
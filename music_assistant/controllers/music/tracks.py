@@ -7,7 +7,7 @@ from typing import List, Optional, Union
 from databases import Database as Db
 
 from music_assistant.helpers.compare import compare_artists, compare_track
-from music_assistant.helpers.database import TABLE_TRACKS
+from music_assistant.helpers.database import TABLE_TRACK_ARTISTS, TABLE_TRACKS
 from music_assistant.helpers.json import json_serializer
 from music_assistant.models.enums import EventType, MediaType, ProviderType
 from music_assistant.models.event import MassEvent
@@ -160,6 +160,9 @@ class TracksController(MediaControllerBase[Track]):
                 db=db,
             )
             item_id = new_item["item_id"]
+            await self._set_db_artists(
+                item_id, track_artists, TABLE_TRACK_ARTISTS, "track_id", db=db
+            )
             # return created object
             self.logger.debug("added %s to database: %s", item.name, item_id)
             db_item = await self.get_db_item(item_id, db=db)
@@ -210,6 +213,9 @@ class TracksController(MediaControllerBase[Track]):
                 },
                 db=db,
             )
+            await self._set_db_artists(
+                item_id, track_artists, TABLE_TRACK_ARTISTS, "track_id", db=db
+            )
             self.logger.debug("updated %s in database: %s", item.name, item_id)
             db_item = await self.get_db_item(item_id, db=db)
             self.mass.signal_event(
@@ -219,6 +225,14 @@ class TracksController(MediaControllerBase[Track]):
             )
             return db_item
 
+    async def delete_db_item(self, item_id: int, db: Optional[Db] = None) -> None:
+        """Delete record from the database."""
+        async with self.mass.database.get_db(db) as db:
+            await self.mass.database.delete(
+                TABLE_TRACK_ARTISTS, {"track_id": int(item_id)}, db=db
+            )
+            await super().delete_db_item(item_id, db)
+
     async def _get_track_artists(
         self,
         base_track: Track,
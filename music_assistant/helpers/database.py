@@ -10,13 +10,15 @@ if TYPE_CHECKING:
     from music_assistant.mass import MusicAssistant
 
 
-SCHEMA_VERSION = 17
+SCHEMA_VERSION = 18
 
 TABLE_TRACK_LOUDNESS = "track_loudness"
 TABLE_PLAYLOG = "playlog"
 TABLE_ARTISTS = "artists"
 TABLE_ALBUMS = "albums"
 TABLE_TRACKS = "tracks"
+TABLE_TRACK_ARTISTS = "track_artists"
+TABLE_ALBUM_ARTISTS = "album_artists"
 TABLE_PLAYLISTS = "playlists"
 TABLE_RADIOS = "radios"
 TABLE_CACHE = "cache"
@@ -168,6 +170,25 @@ class Database:
             }
             return await self.get_row(table, lookup_vals, db=_db)
 
+    async def insert_many(
+        self,
+        table: str,
+        values: List[Dict[str, Any]],
+        ignore_existing: bool = False,
+        db: Optional[Db] = None,
+    ) -> None:
+        """Insert multiple rows (with the same keys) in given table in a single call."""
+        if not values:
+            return
+        async with self.get_db(db) as _db:
+            keys = tuple(values[0].keys())
+            if ignore_existing:
+                sql_query = f'INSERT OR IGNORE INTO {table}({",".join(keys)})'
+            else:
+                sql_query = f'INSERT INTO {table}({",".join(keys)})'
+            sql_query += f' VALUES ({",".join((f":{x}" for x in keys))})'
+            await _db.execute_many(sql_query, values)
+
     async def insert_or_replace(
         self, table: str, values: Dict[str, Any], db: Optional[Db] = None
     ) -> Mapping:
@@ -202,12 +223,16 @@ class Database:
             await _db.execute(sql_query, match)
 
     async def delete_where_query(
-        self, table: str, query: str, db: Optional[Db] = None
+        self,
+        table: str,
+        query: str,
+        params: Optional[dict] = None,
+        db: Optional[Db] = None,
     ) -> None:
         """Delete data in given table using given where clausule."""
         async with self.get_db(db) as _db:
             sql_query = f"DELETE FROM {table} WHERE {query}"
-            await _db.execute(sql_query)
+            await _db.execute(sql_query, params)
 
     async def _migrate(self):
         """Perform database migration actions if needed."""
@@ -242,6 +267,19 @@ class Database:
                     # recreate missing tables
                     await self.__create_database_tables(db)
 
+                if prev_version < 18:
+                    # fill the artist join tables from the (existing) json columns
+                    await db.execute(
+                        f"""INSERT OR IGNORE INTO {TABLE_TRACK_ARTISTS}(track_id, artist_id)
+                        SELECT {TABLE_TRACKS}.item_id, json_extract(json_each.value, '$.item_id')
+                        FROM {TABLE_TRACKS}, json_each({TABLE_TRACKS}.artists)"""
+                    )
+                    await db.execute(
+                        f"""INSERT OR IGNORE INTO {TABLE_ALBUM_ARTISTS}(album_id, artist_id)
+                        SELECT {TABLE_ALBUMS}.item_id, json_extract(json_each.value, '$.item_id')
+                        FROM {TABLE_ALBUMS}, json_each({TABLE_ALBUMS}.artists)"""
+                    )
+
             # store current schema version
             await self.set_setting("version", str(SCHEMA_VERSION), db=db)
 
@@ -307,6 +345,20 @@ class Database:
                     provider_ids json
                 );"""
         )
+        await db.execute(
+            f"""CREATE TABLE IF NOT EXISTS {TABLE_TRACK_ARTISTS}(
+                    track_id INTEGER NOT NULL,
+                    artist_id INTEGER NOT NULL,
+                    UNIQUE(track_id, artist_id)
+                );"""
+        )
+        await db.execute(
+            f"""CREATE TABLE IF NOT EXISTS {TABLE_ALBUM_ARTISTS}(
+                    album_id INTEGER NOT NULL,
+                    artist_id INTEGER NOT NULL,
+                    UNIQUE(album_id, artist_id)
+                );"""
+        )
         await db.execute(
             f"""CREATE TABLE IF NOT EXISTS {TABLE_PLAYLISTS}(
                     item_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -384,3 +436,9 @@ class Database:
         )
         await db.execute("CREATE INDEX IF NOT EXISTS tracks_isrc_idx on tracks(isrc);")
         await db.execute("CREATE INDEX IF NOT EXISTS albums_upc_idx on albums(upc);")
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS track_artists_artist_id_idx on track_artists(artist_id);"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS album_artists_artist_id_idx on album_artists(artist_id);"
+        )
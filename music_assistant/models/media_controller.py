@@ -19,7 +19,7 @@ from music_assistant.models.errors import MediaNotFoundError, ProviderUnavailabl
 from music_assistant.models.event import MassEvent
 
 from .enums import EventType, MediaType, ProviderType
-from .media_items import MediaItemType, media_from_dict
+from .media_items import ItemMapping, MediaItemType, media_from_dict
 
 if TYPE_CHECKING:
     from music_assistant.mass import MusicAssistant
@@ -395,3 +395,26 @@ class MediaControllerBase(Generic[ItemCls], metaclass=ABCMeta):
             )
         # NOTE: this does not delete any references to this item in other records!
         self.logger.debug("deleted item with id %s from database", item_id)
+
+    async def _set_db_artists(
+        self,
+        item_id: int,
+        artists: List[ItemMapping],
+        join_table: str,
+        join_column: str,
+        db: Optional[Db] = None,
+    ) -> None:
+        """Store the (database) artists of an item in the given artist join table."""
+        async with self.mass.database.get_db(db) as db:
+            await self.mass.database.delete(
+                join_table, {join_column: int(item_id)}, db=db
+            )
+            await self.mass.database.insert_many(
+                join_table,
+                [
+                    {join_column: int(item_id), "artist_id": int(artist.item_id)}
+                    for artist in artists
+                ],
+                ignore_existing=True,
+                db=db,
+            )
@@ -0,0 +1,119 @@
+"""Tests for the database helper and artist join tables."""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from music_assistant.controllers.music.artists import ArtistsController
+from music_assistant.helpers.database import (
+    TABLE_ALBUM_ARTISTS,
+    TABLE_ALBUMS,
+    TABLE_TRACK_ARTISTS,
+    TABLE_TRACKS,
+    Database,
+)
+
+
+def _get_mass(tmp_path):
+    """Return a minimal mass object with an (initialized) database."""
+    mass = SimpleNamespace(
+        config=SimpleNamespace(database_url=f"sqlite:///{tmp_path}/test.db"),
+        logger=logging.getLogger("test"),
+    )
+    mass.database = Database(mass)
+    asyncio.run(mass.database.setup())
+    return mass
+
+
+async def _get_join_rows(database, table):
+    """Return all rows of a join table as (sorted) tuples."""
+    return sorted(tuple(row) for row in await database.get_rows(table))
+
+
+def test_migrate_artist_join_tables(tmp_path):
+    """Test the artist join tables are filled when migrating from schema 17."""
+    database = _get_mass(tmp_path).database
+
+    async def run():
+        artists = '[{"item_id": "3", "provider": "database"}, {"item_id": "4", "provider": "database"}]'
+        await database.insert(
+            TABLE_TRACKS, {"name": "track", "sort_name": "track", "artists": artists}
+        )
+        await database.insert(
+            TABLE_ALBUMS, {"name": "album", "sort_name": "album", "artists": artists}
+        )
+        await database.insert(TABLE_ALBUMS, {"name": "other", "sort_name": "other"})
+        # pretend we have a schema 17 db without the join rows
+        await database.delete_where_query(TABLE_TRACK_ARTISTS, "1")
+        await database.delete_where_query(TABLE_ALBUM_ARTISTS, "1")
+        await database.set_setting("version", "17")
+        await database.setup()
+        return (
+            await _get_join_rows(database, TABLE_TRACK_ARTISTS),
+            await _get_join_rows(database, TABLE_ALBUM_ARTISTS),
+        )
+
+    track_artists, album_artists = asyncio.run(run())
+    # the (string) item_ids from the json column are stored as integers
+    assert track_artists == [(1, 3), (1, 4)]
+    assert album_artists == [(1, 3), (1, 4)]
+
+
+def test_insert_many(tmp_path):
+    """Test inserting multiple rows, ignoring existing ones."""
+    database = _get_mass(tmp_path).database
+
+    async def run():
+        rows = [
+            {"track_id": 1, "artist_id": 2},
+            {"track_id": 1, "artist_id": 3},
+            {"track_id": 1, "artist_id": 3},
+        ]
+        await database.insert_many(TABLE_TRACK_ARTISTS, rows, ignore_existing=True)
+        await database.insert_many(TABLE_TRACK_ARTISTS, rows, ignore_existing=True)
+        await database.insert_many(TABLE_TRACK_ARTISTS, [])
+        return await _get_join_rows(database, TABLE_TRACK_ARTISTS)
+
+    assert asyncio.run(run()) == [(1, 2), (1, 3)]
+
+
+def test_delete_artist(tmp_path):
+    """Test deleting an artist removes its tracks, albums and join rows."""
+    mass = _get_mass(tmp_path)
+    database = mass.database
+    artists = ArtistsController(mass)
+
+    async def run():
+        for name in ("first", "second"):
+            await database.insert(TABLE_TRACKS, {"name": name, "sort_name": name})
+            await database.insert(TABLE_ALBUMS, {"name": name, "sort_name": name})
+        # track/album 1 belong to artists 5 and 6, track/album 2 only to artist 6
+        await database.insert_many(
+            TABLE_TRACK_ARTISTS,
+            [
+                {"track_id": 1, "artist_id": 5},
+                {"track_id": 1, "artist_id": 6},
+                {"track_id": 2, "artist_id": 6},
+            ],
+        )
+        await database.insert_many(
+            TABLE_ALBUM_ARTISTS,
+            [
+                {"album_id": 1, "artist_id": 5},
+                {"album_id": 1, "artist_id": 6},
+                {"album_id": 2, "artist_id": 6},
+            ],
+        )
+        await artists.delete_db_item(5)
+        return (
+            [row["item_id"] for row in await database.get_rows(TABLE_TRACKS)],
+            [row["item_id"] for row in await database.get_rows(TABLE_ALBUMS)],
+            await _get_join_rows(database, TABLE_TRACK_ARTISTS),
+            await _get_join_rows(database, TABLE_ALBUM_ARTISTS),
+        )
+
+    tracks, albums, track_artists, album_artists = asyncio.run(run())
+    assert tracks == [2]
+    assert albums == [2]
+    assert track_artists == [(2, 6)]
+    assert album_artists == [(2, 6)]
@@ -0,0 +1,62 @@
+"""Tests for the MusicBrainz metadata helper."""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from music_assistant.controllers.metadata.musicbrainz import UPC_BATCH_SIZE, MusicBrainz
+
+
+def _get_musicbrainz(releases):
+    """Return MusicBrainz instance with mocked api, returning the given releases."""
+    mass = SimpleNamespace(cache=None, logger=logging.getLogger("test"))
+    musicbrainz = MusicBrainz(mass)
+    queries = []
+
+    async def get_data(endpoint, **kwargs):
+        assert endpoint == "release"
+        queries.append(kwargs["query"])
+        return {"releases": releases}
+
+    musicbrainz.get_data = get_data
+    return musicbrainz, queries
+
+
+def _get_release(artist_name, artist_id, aliases=None):
+    """Return (minimal) musicbrainz release payload."""
+    artist = {"id": artist_id, "name": artist_name}
+    if aliases:
+        artist["aliases"] = [{"name": alias} for alias in aliases]
+    return {"artist-credit": [{"name": artist_name, "artist": artist}]}
+
+
+def test_search_artist_by_album_upcs():
+    """Test batched lookup of artist id by album barcodes."""
+    musicbrainz, queries = _get_musicbrainz(
+        [_get_release("Other Artist", "other"), _get_release("Artist", "artist-id")]
+    )
+    result = asyncio.run(
+        musicbrainz.search_artist_by_album_upcs("Artist", ["123", "456"])
+    )
+    assert result == "artist-id"
+    assert queries == ["barcode:123 OR barcode:456"]
+
+
+def test_search_artist_by_album_upcs_batches():
+    """Test barcodes are searched in batches of UPC_BATCH_SIZE."""
+    musicbrainz, queries = _get_musicbrainz([_get_release("Other", "other")])
+    upcs = [str(x) for x in range(UPC_BATCH_SIZE + 1)]
+    result = asyncio.run(musicbrainz.search_artist_by_album_upcs("Artist", upcs))
+    assert result == ""
+    assert len(queries) == 2
+    assert queries[0] == " OR ".join(f"barcode:{x}" for x in upcs[:UPC_BATCH_SIZE])
+    assert queries[1] == f"barcode:{upcs[-1]}"
+
+
+def test_search_artist_by_album_upcs_alias():
+    """Test the artist id is found by one of the artist's aliases."""
+    musicbrainz, _ = _get_musicbrainz(
+        [_get_release("Unknown Name", "artist-id", aliases=["Artist"])]
+    )
+    result = asyncio.run(musicbrainz.search_artist_by_album_upcs("Artist", ["123"]))
+    assert result == "artist-id"